@@ -11,7 +11,7 @@ from typing import Optional  # Python < 3.10 compatibility
 
 import cv2, pygame
 
-from clip_utils import start_clip, update_clips  # external helpers
+from clip_utils import start_clip, update_clips, MIXER_INIT, NUM_CHANNELS  # external helpers
 
 HD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "HD")
 
@@ -58,7 +58,8 @@ def start_stream_gst(path: str, pi_host: str, v_port: int = 5000, a_port: int =
         "d.video ! queue ! videoconvert ! vtenc_h264 ! "
         "rtph264pay config-interval=1 pt=96 ! "
         f"udpsink host={pi_host} port={v_port} "
-        "d.audio ! queue ! audioconvert ! audioresample ! avenc_aac ! "
+        "d.audio ! queue ! audioconvert ! audioresample ! "
+        "audio/x-raw,rate=44100,channels=2 ! avenc_aac ! "    # same as the ffmpeg path
         "rtpmp4gpay pt=97 ! "
         f"udpsink host={pi_host} port={a_port}"
     )
@@ -118,9 +119,9 @@ def main():
         print("No matching .mp4/.wav pairs in HD/")
         return
 
-    pygame.mixer.pre_init(44100, -16, 2, 512)
+    pygame.mixer.pre_init(*MIXER_INIT)
     pygame.init()
-    pygame.mixer.set_num_channels(32)
+    pygame.mixer.set_num_channels(NUM_CHANNELS)
 
     stream_proc: Optional[subprocess.Popen] = None
     idx = 0
@@ -19,11 +19,12 @@ material, the shrinking spectrum *sounds* like a high‑pass filter.
 
 from __future__ import annotations
 
+import json
 import os
 import random
 import re
 import time
-from typing import Optional, Set, Tuple, Dict
+from typing import Optional, Set, Tuple, Dict, Iterable, List
 
 import pygame
 
@@ -36,9 +37,20 @@ HP_FADE_MAX: float    = 120.0   # max duration of high‑pass fade‑out
 PLAY_FADE_MS: int     = 200    # fade‑in when a clip starts (ms)
 STOP_FADE_MS: int     = 300    # fade‑out when a clip is stopped (ms)
 PAN_JITTER: float     = 1.2    # ± range of random pan drift per frame
+PRESSURE_LOG_S: float = 30.0   # print channel_pressure() this often (0 = never)
 
 master_gain: float    = 1.0    # global gain slider (0‑1)
 
+# mixer format – every player initialises pygame.mixer with exactly this
+MIXER_FREQ: int       = 44100
+MIXER_SIZE: int       = -16     # signed 16‑bit
+MIXER_CHANNELS: int   = 2
+MIXER_BUFFER: int     = 512
+NUM_CHANNELS: int     = 32
+MIXER_INIT = (MIXER_FREQ, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)   # pre_init(*MIXER_INIT)
+
+PCM_DIR: str          = ".pcm"  # pre‑converted cache inside HD/ (see pcm_cache.py)
+
 # ---------------------------------------------------------------------------
 # 1.  Filename‑parsing utilities
 # ---------------------------------------------------------------------------
@@ -67,7 +79,9 @@ def parse_suffix(name: str) -> Tuple[str, Set[str], float]:
 
 def resolve_audio_name(base: str, hd_dir: str) -> Optional[str]:
     base_lc = base.lower()
-    wavs = [f for f in os.listdir(hd_dir) if f.lower().endswith(".wav")]
+    # sorted: listdir order differs between hosts, and synced nodes must
+    # pick the same variant from the same seeded random state
+    wavs = sorted(f for f in os.listdir(hd_dir) if f.lower().endswith(".wav"))
 
     # exact match first
     for f in wavs:
@@ -96,6 +110,11 @@ class Clip:
         # finite looping
         self.max_loops: Optional[int] = random.randint(1, 10) if "o" in flags else None
 
+        # voice bookkeeping (see section 4b)
+        self.started_at: float = 0.0     # wall time playback (virtually) began
+        self.chan_idx: Optional[int] = None   # mixer channel index while real
+        self.requeue: int = 0            # full plays still to queue after a resumed tail (‑1 = forever)
+
         # high‑pass fade
         if "h" in flags:
             self.fade_start = time.time()
@@ -108,6 +127,11 @@ class Clip:
     def chan(self) -> Optional[pygame.mixer.Channel]:
         return None if self.active is None else self.active[1]
 
+    @property
+    def virtual(self) -> bool:
+        """Loaded and tracked, but currently without a mixer channel."""
+        return self.active is not None and self.active[1] is None
+
 # key: plain video‑basename
 active_clips: Dict[str, Clip] = {}
 solo_owner: Optional[str] = None   # base name of current solo clip (if any)
@@ -124,26 +148,268 @@ def _restore_all_volumes():
 def _stop_clip_by_base(base: str):
     global solo_owner
     clip = active_clips.pop(base, None)
-    if not clip or not clip.chan:
+    if not clip:
         return
-    clip.chan.fadeout(STOP_FADE_MS)
+    if clip.chan:
+        clip.chan.fadeout(STOP_FADE_MS)
+    _release(clip)
 
     # if this was the solo owner, un‑mute others
     if base == solo_owner:
         solo_owner = None
         _restore_all_volumes()
 
-def _add_audio(wav_name: str, gain: float, hd_dir: str, loops: int) -> Tuple[pygame.mixer.Sound, Optional[pygame.mixer.Channel]]:
+# wav_name → (source, load ms) for every Sound built this session
+load_times: Dict[str, Tuple[str, float]] = {}
+# wav_name → Sound that was live at the last reset_state(); replaced at every
+# reset, so it never holds more than one mode's worth of audio
+sound_cache: Dict[str, pygame.mixer.Sound] = {}
+# hd_dir → (index.json mtime, index); re‑read whenever pcm_cache.py rewrites it
+_pcm_index: Dict[str, Tuple[float, dict]] = {}
+
+
+def _pcm_entry(wav_name: str, hd_dir: str) -> Optional[dict]:
+    """Index entry for a cached clip, if it is fresh and in the live mixer format."""
+    idx_path = os.path.join(hd_dir, PCM_DIR, "index.json")
+    try:
+        mtime = os.path.getmtime(idx_path)
+    except OSError:
+        return None
+    cached = _pcm_index.get(hd_dir)
+    if cached is None or cached[0] != mtime:
+        try:
+            with open(idx_path) as fh:
+                _pcm_index[hd_dir] = (mtime, json.load(fh))
+        except (OSError, ValueError):
+            return None
+    entry = _pcm_index[hd_dir][1].get(wav_name)
+    if not entry or tuple(entry["format"]) != pygame.mixer.get_init():
+        return None
+    try:
+        if os.path.getmtime(os.path.join(hd_dir, f"{wav_name}.wav")) > entry["mtime"]:
+            return None
+    except OSError:
+        return None
+    return entry
+
+
+def _load_sound(wav_name: str, hd_dir: str) -> pygame.mixer.Sound:
+    """Build a Sound, preferring Sounds kept across a reset, then the PCM cache, then the WAV."""
+    snd = sound_cache.get(wav_name)
+    if snd is not None:
+        return snd
+    return _build_sound(wav_name, hd_dir)
+
+
+def _build_sound(wav_name: str, hd_dir: str) -> pygame.mixer.Sound:
+    t0 = time.perf_counter()
+    entry = _pcm_entry(wav_name, hd_dir)
+    if entry:
+        import numpy as np                       # only needed once a PCM cache exists
+        pcm = np.load(os.path.join(hd_dir, PCM_DIR, f"{wav_name}.npy"), mmap_mode="r")
+        snd = pygame.mixer.Sound(buffer=pcm)      # no decode, no resample
+        ms = (time.perf_counter() - t0) * 1000.0
+        load_times[wav_name] = ("pcm", ms)
+        print(f"[audio] {wav_name}: {ms:.1f} ms from cache "
+              f"(saved {entry['wav_ms'] - ms:.1f} ms)")
+        return snd
+
     snd = pygame.mixer.Sound(os.path.join(hd_dir, f"{wav_name}.wav"))
-    chan = snd.play(loops=loops, fade_ms=PLAY_FADE_MS)
+    load_times[wav_name] = ("wav", (time.perf_counter() - t0) * 1000.0)
+    return snd
+
+def _loops_for(clip: Clip) -> int:
+    """pygame ``loops`` argument for a clip's flags (0 = once, -1 = forever)."""
+    if "t" in clip.flags:
+        return 0
+    if "o" in clip.flags:
+        return (clip.max_loops or 1) - 1
+    return -1
+
+# ---------------------------------------------------------------------------
+# 4b.  Voice management – priority stealing + virtual voices
+# ---------------------------------------------------------------------------
+# When all NUM_CHANNELS are busy a new clip steals the lowest‑priority,
+# quietest, oldest voice.  The loser is *virtualised*: it keeps its Sound and
+# its wall‑clock start, so update_clips() can resume it at the right sample
+# offset once a channel frees up.
+PRIO_LOW, PRIO_NORMAL, PRIO_HIGH = 0, 1, 2
+
+voice_stats: Dict[str, int] = {
+    "steals": 0,        # channels taken from a lower/equal‑priority clip
+    "virtualised": 0,   # clips that lost (or never got) a channel
+    "resumed": 0,       # virtual clips put back on a channel
+    "expired": 0,       # finite virtual clips that ended while silent
+    "peak_busy": 0,     # most channels busy at once
+}
+
+
+def _priority(clip: Clip) -> int:
+    if clip.flags & {"s", "d"}:
+        return PRIO_HIGH
+    if "v" in clip.flags:
+        return PRIO_LOW
+    return PRIO_NORMAL
+
+
+# channel index → clip playing on it.  Busy channels *not* in here belong to
+# stopped clips that are still fading out.
+_chan_owner: Dict[int, Clip] = {}
+_released_at: Dict[int, float] = {}      # channel index → when its clip let go
+
+
+def _claim(clip: Clip, idx: int) -> pygame.mixer.Channel:
+    _chan_owner[idx] = clip
+    _released_at.pop(idx, None)
+    clip.chan_idx = idx
+    return pygame.mixer.Channel(idx)
+
+
+def _release(clip: Clip):
+    idx = clip.chan_idx
+    if idx is None:
+        return
+    if _chan_owner.get(idx) is clip:
+        del _chan_owner[idx]
+    _released_at[idx] = time.time()
+    clip.chan_idx = None
+
+
+def _virtualise(clip: Clip):
+    snd, chan = clip.active
+    if chan:
+        chan.stop()
+    _release(clip)
+    clip.active = (snd, None)
+    clip.requeue = 0
+    voice_stats["virtualised"] += 1
+
+
+def _free_channel(prio: int, steal: bool = True, protect: Iterable[Clip] = ()) -> Optional[int]:
+    """Index of an idle channel; with *steal*, else a fading one, else a victim's.
+
+    Clips in *protect* (e.g. the rest of a scene batch) are never stolen from.
+    """
+    fading = []
+    for i in range(pygame.mixer.get_num_channels()):
+        if i in _chan_owner:
+            continue
+        if not pygame.mixer.Channel(i).get_busy():
+            return i
+        fading.append(i)
+
+    if not steal:
+        return None                                  # resume waits for the fades to end
+    if fading:
+        # already near silence – cut the one that has been fading longest
+        i = min(fading, key=lambda i: _released_at.get(i, 0.0))
+        pygame.mixer.Channel(i).stop()
+        return i
+
+    protect = list(protect)
+    victims = [c for c in active_clips.values()
+               if c.chan and _priority(c) <= prio and c not in protect]
+    if not victims:
+        return None
+    victim = min(victims, key=lambda c: (_priority(c), c.chan.get_volume(), c.started_at))
+    idx = victim.chan_idx
+    _virtualise(victim)
+    voice_stats["steals"] += 1
+    return idx
+
+
+def _play_voice(clip: Clip, snd: pygame.mixer.Sound,
+                protect: Iterable[Clip] = ()) -> Optional[pygame.mixer.Channel]:
+    """Start *snd* for *clip*; without a channel the clip starts out virtual."""
+    clip.started_at = time.time()
+    idx = _free_channel(_priority(clip), protect=protect)
+    if idx is None:
+        clip.active = (snd, None)
+        voice_stats["virtualised"] += 1
+        return None
+    chan = _claim(clip, idx)
+    chan.play(snd, loops=_loops_for(clip), fade_ms=PLAY_FADE_MS)
+    clip.active = (snd, chan)
+    return chan
+
+
+def _note_busy():
+    """Update voice_stats["peak_busy"]; call *after* starting voices, never between play/pause."""
+    busy = sum(pygame.mixer.Channel(i).get_busy() for i in range(pygame.mixer.get_num_channels()))
+    voice_stats["peak_busy"] = max(voice_stats["peak_busy"], busy)
+
+
+def _resume_virtual(now: float):
+    """Put virtual clips back on idle channels, highest priority first."""
+    virtual = [c for c in active_clips.values() if c.virtual]
+    if not virtual:
+        return
+    freq, size, n_ch = pygame.mixer.get_init()
+    frame_bytes = abs(size) // 8 * n_ch
+
+    for c in sorted(virtual, key=lambda c: (-_priority(c), c.started_at)):
+        snd = c.active[0]
+        length = snd.get_length()
+        loops = _loops_for(c)
+        done, pos = divmod(now - c.started_at, length) if length > 0 else (0, 0.0)
+        if (loops >= 0 and done > loops) or (c.fade_dur and now - c.fade_start >= c.fade_dur):
+            _stop_clip_by_base(c.base)
+            voice_stats["expired"] += 1
+            continue
+
+        idx = _free_channel(_priority(c), steal=False)
+        if idx is None:
+            return                                       # nothing free – try next frame
+        # view the Sound's own samples; the only copy is the one Sound(buffer=) makes
+        pcm = memoryview(snd).cast("B")
+        off = int(pos * freq) * frame_bytes
+        tail = pygame.mixer.Sound(buffer=pcm[off:]) if off < len(pcm) else snd
+        chan = _claim(c, idx)
+        chan.play(tail, fade_ms=PLAY_FADE_MS)
+        c.requeue = -1 if loops < 0 else int(loops - done)
+        c.active = (snd, chan)
+        voice_stats["resumed"] += 1
+
+
+def channel_pressure() -> Dict[str, int]:
+    """Snapshot of mixer channel usage plus the running voice_stats counters."""
+    n = pygame.mixer.get_num_channels()
+    return {
+        "channels": n,
+        "busy": sum(pygame.mixer.Channel(i).get_busy() for i in range(n)),
+        "real": sum(1 for c in active_clips.values() if c.chan),
+        "virtual": sum(1 for c in active_clips.values() if c.virtual),
+        **voice_stats,
+    }
+
+
+def _add_audio(clip: Clip, gain: float, hd_dir: str,
+               snd: Optional[pygame.mixer.Sound] = None) -> Tuple[pygame.mixer.Sound, Optional[pygame.mixer.Channel]]:
+    if snd is None:
+        snd = _load_sound(clip.wav_name, hd_dir)
+    chan = _play_voice(clip, snd)
     if chan:
         chan.set_volume(gain)
+    _note_busy()
     return snd, chan
 
 # ---------------------------------------------------------------------------
 # 5.  Public API
 # ---------------------------------------------------------------------------
 
+# video‑basename → (wav_name, Sound) resolved + loaded ahead of start_clip()
+_armed: Dict[str, Tuple[str, pygame.mixer.Sound]] = {}
+
+
+def arm_clip(video_base: str, hd_dir: str) -> bool:
+    """Resolve and load *video_base*'s WAV now so the next start_clip() only plays it."""
+    wav_name = resolve_audio_name(video_base, hd_dir)
+    if wav_name is None:
+        return False
+    _armed[video_base] = (wav_name, _load_sound(wav_name, hd_dir))
+    return True
+
+
 def start_clip(video_base: str, hd_dir: str) -> Optional[Clip]:
     global solo_owner
 
@@ -151,7 +417,9 @@ def start_clip(video_base: str, hd_dir: str) -> Optional[Clip]:
     if solo_owner and solo_owner != video_base and solo_owner in active_clips:
         _stop_clip_by_base(solo_owner)
 
-    wav_name = resolve_audio_name(video_base, hd_dir)
+    wav_name, snd = _armed.pop(video_base, (None, None))
+    if wav_name is None:
+        wav_name = resolve_audio_name(video_base, hd_dir)
     if wav_name is None:
         print(f"[audio] missing wav for {video_base}")
         return None
@@ -163,17 +431,9 @@ def start_clip(video_base: str, hd_dir: str) -> Optional[Clip]:
 
     clip = Clip(wav_name, base, flags, vol)
 
-    # loop semantics
-    if "t" in flags:
-        loops = 0
-    elif "o" in flags:
-        loops = (clip.max_loops or 1) - 1
-    else:
-        loops = -1
-
-    snd, chan = _add_audio(wav_name, vol * master_gain, hd_dir, loops)
-    clip.active = (snd, chan)
+    _add_audio(clip, vol * master_gain, hd_dir, snd)
     active_clips[base] = clip
+    _note_transition(clip)
 
     # variable replacement (_v)
     if "v" in flags:
@@ -203,17 +463,133 @@ def start_clip(video_base: str, hd_dir: str) -> Optional[Clip]:
 
     return clip
 
+def start_scene(video_bases: Iterable[str], hd_dir: str,
+                stop: Iterable[str] = ()) -> Dict[str, Clip]:
+    """Start (and optionally stop) a whole set of clips in one pass.
+
+    Unlike calling :func:`start_clip` in a loop, every WAV is resolved and
+    loaded *before* anything changes, the final ``_v``/``_d``/``_s`` state is
+    computed once for the whole scene, and every new channel is paused right
+    after ``play()`` and then released together with a single
+    ``pygame.mixer.unpause()``.  Nothing else runs between each play/pause
+    pair, so the layers almost always start inside the same audio buffer –
+    but the audio thread *can* mix one buffer of an early layer before it is
+    paused, so this is best effort, not a guarantee.
+
+    Scene rules (order‑independent, apart from the last ``_s`` clip winning):
+        • the last ``_s`` clip in *video_bases* becomes the solo owner;
+        • every ``_d`` clip ducks all clips that are not themselves ``_d``;
+        • each ``_v`` clip may replace one *pre‑existing* ``_v`` clip.
+
+    Returns the started clips keyed by base name.
+    """
+    global solo_owner
+
+    # -- 1. resolve + load everything up front (disk I/O happens here) ------
+    planned: Dict[str, Clip] = {}
+    sounds: Dict[str, pygame.mixer.Sound] = {}
+    for vb in video_bases:
+        wav_name = resolve_audio_name(vb, hd_dir)
+        if wav_name is None:
+            print(f"[audio] missing wav for {vb}")
+            continue
+        base, flags, vol = parse_suffix(wav_name)
+        planned.pop(base, None)                   # last mention wins
+        planned[base] = Clip(wav_name, base, flags, vol)
+        sounds[base] = _load_sound(wav_name, hd_dir)
+
+    # -- 2. compute the final state once ------------------------------------
+    to_stop: Set[str] = {b for b in stop if b in active_clips}
+    to_stop.update(b for b in planned if b in active_clips)
+
+    solos = [b for b, c in planned.items() if "s" in c.flags]
+    new_solo = solos[-1] if solos else None
+    if solo_owner and solo_owner in active_clips and planned and solo_owner not in planned:
+        to_stop.add(solo_owner)               # same rule as start_clip()
+
+    survivors = [c for b, c in active_clips.items() if b not in to_stop]
+    v_pool = [c for c in survivors if "v" in c.flags]
+    for c in planned.values():
+        if "v" in c.flags and v_pool and random.random() < 0.6:
+            victim = random.choice(v_pool)
+            v_pool.remove(victim)
+            to_stop.add(victim.base)
+
+    for b in to_stop:
+        _stop_clip_by_base(b)
+
+    final_solo = new_solo or (solo_owner if solo_owner in active_clips else None)
+    ducking = any("d" in c.flags for c in planned.values())
+    now = time.time()
+
+    def _target(c: Clip) -> float:
+        # duck first, then solo – same order as start_clip(), so a muted clip
+        # still comes back ducked once the solo ends
+        ducked = ducking and "d" not in c.flags
+        if ducked:
+            c.duck_end = now + DUCK_TIME
+        if final_solo and c.base != final_solo:
+            return 0.0
+        if ducked:
+            return c.base_vol * 0.5 * master_gain
+        return c.base_vol * master_gain
+
+    # -- 3. start every channel paused, then release them together ----------
+    # highest priority first; batch members never steal from each other
+    started: List[Clip] = []
+    for b, c in sorted(planned.items(), key=lambda kv: -_priority(kv[1])):
+        chan = _play_voice(c, sounds[b], protect=started)
+        if chan:
+            chan.pause()
+            chan.set_volume(_target(c))
+        active_clips[b] = c
+        started.append(c)
+
+    for c in active_clips.values():
+        if c.chan and c not in started:
+            c.chan.set_volume(_target(c))
+
+    solo_owner = final_solo
+    pygame.mixer.unpause()
+    _note_busy()
+    for c in started:
+        _note_transition(c)
+
+    return {c.base: c for c in started}
+
 # ---------------------------------------------------------------------------
 # 6.  Per‑frame update
 # ---------------------------------------------------------------------------
 
+_last_pressure_log: float = 0.0
+
+
 def update_clips(dt: float):
+    global _last_pressure_log
     now = time.time()
+    _resume_virtual(now)
+    if PRESSURE_LOG_S and now - _last_pressure_log >= PRESSURE_LOG_S:
+        _last_pressure_log = now
+        p = channel_pressure()
+        print(f"[audio] voices {p['busy']}/{p['channels']} busy, {p['virtual']} virtual  "
+              f"(steals {p['steals']}, resumed {p['resumed']}, peak {p['peak_busy']})")
     for base, clip in list(active_clips.items()):
         chan = clip.chan
         if not chan:
             continue
 
+        # keep a resumed clip looping: re‑queue the full sound behind the tail
+        if clip.requeue and not chan.get_busy():
+            # a stall outlived the queue – restart with native loops so the
+            # voice can't go idle (and leak its channel) again
+            n = clip.requeue
+            chan.play(clip.active[0], loops=-1 if n < 0 else n - 1)
+            clip.requeue = 0
+        elif clip.requeue and chan.get_queue() is None:
+            chan.queue(clip.active[0])
+            if clip.requeue > 0:
+                clip.requeue -= 1
+
         # auto‑remove finished finite loops
         if not chan.get_busy() and ("t" in clip.flags or "o" in clip.flags):
             _stop_clip_by_base(base)
@@ -264,3 +640,43 @@ def stop_all(fade_ms: int = STOP_FADE_MS):
     global solo_owner
     solo_owner = None
 
+
+# mode‑switch timing: reset_state() request → first start_clip() with a channel
+transition_ms: Optional[float] = None
+_transition_t0: Optional[float] = None
+
+
+def _note_transition(clip: Clip):
+    global transition_ms, _transition_t0
+    if _transition_t0 is None or not clip.chan:
+        return
+    transition_ms = (time.perf_counter() - _transition_t0) * 1000.0
+    _transition_t0 = None
+    print(f"[audio] mode switch → first clip '{clip.base}' in {transition_ms:.0f} ms")
+
+
+def reset_state(fade_ms: int = STOP_FADE_MS, requested_at: Optional[float] = None):
+    """Fast mode‑switch reset: keep the audio device and the live Sounds.
+
+    Fades every channel out (fading channels are recycled by the voice
+    manager as soon as a new clip needs one), keeps the Sounds of the clips
+    that were playing in ``sound_cache`` and drops everything else, plus all
+    clip / solo / duck / virtual‑voice state.  The transition is timed from
+    *requested_at* (``time.perf_counter()``, default now) to the next clip
+    that actually gets a channel – see ``transition_ms``.
+    """
+    global solo_owner, _transition_t0
+    _transition_t0 = requested_at if requested_at is not None else time.perf_counter()
+    pygame.mixer.fadeout(fade_ms)
+
+    live = {c.wav_name: c.active[0] for c in active_clips.values() if c.active}
+    live.update(_armed.values())
+    sound_cache.clear()
+    sound_cache.update(live)
+
+    for c in active_clips.values():
+        _release(c)
+    active_clips.clear()
+    _armed.clear()
+    solo_owner = None
+
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Ingest step: convert every HD/*.wav once into raw PCM that already matches
+the mixer format (clip_utils.MIXER_INIT), so players never decode or
+resample at load time.  The conversion itself is SDL's (Sound.get_raw() on
+the initialised mixer), so cached clips are byte‑identical to the WAV path.
+
+    python pcm_cache.py            # convert new / changed WAVs
+    python pcm_cache.py --force    # rebuild everything
+
+Output lives in HD/.pcm/:
+    <wav_name>.npy   int16 frames × channels, memory‑mappable (np.load mmap_mode="r")
+    index.json       {wav_name: {"format", "mtime", "wav_ms", "pcm_ms"}}
+
+clip_utils._load_sound() picks these up automatically and falls back to the
+WAV whenever the cache is missing, stale or in a different mixer format.
+"""
+import os, sys, json, time, argparse
+
+import numpy as np
+import pygame
+
+from clip_utils import MIXER_INIT, PCM_DIR
+
+HD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "HD")
+
+# ────────────────────────────────────────────────────────────────────
+#  Ingest
+# ────────────────────────────────────────────────────────────────────
+
+def _time_ms(fn) -> float:
+    t0 = time.perf_counter(); fn()
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def _write_index(path: str, index: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w") as fh:
+        json.dump(index, fh, indent=1)
+    os.replace(tmp, path)
+
+
+def ingest(hd_dir: str = HD_DIR, force: bool = False) -> dict:
+    """Convert every WAV in *hd_dir*; return the updated index."""
+    out_dir = os.path.join(hd_dir, PCM_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    idx_path = os.path.join(out_dir, "index.json")
+    try:
+        with open(idx_path) as fh:
+            index = json.load(fh)
+    except (OSError, ValueError):
+        index = {}
+
+    fmt = pygame.mixer.get_init()                   # (freq, size, channels)
+    freq, size, channels = fmt
+    if size != -16:
+        raise SystemExit(f"pcm_cache only writes signed 16‑bit, mixer is {size}")
+
+    total_saved = 0.0
+    for f in sorted(os.listdir(hd_dir)):
+        if not f.lower().endswith(".wav"):
+            continue
+        name = os.path.splitext(f)[0]
+        wav_path = os.path.join(hd_dir, f)
+        npy_path = os.path.join(out_dir, f"{name}.npy")
+        mtime = os.path.getmtime(wav_path)
+
+        entry = index.get(name)
+        if (not force and entry and entry["mtime"] >= mtime
+                and tuple(entry["format"]) == fmt and os.path.exists(npy_path)):
+            continue
+
+        try:
+            raw = pygame.mixer.Sound(wav_path).get_raw()
+        except (pygame.error, OSError, EOFError) as exc:     # empty / truncated / not a WAV
+            print(f"[pcm] skip {f}: {exc}")
+            continue
+        np.save(npy_path, np.frombuffer(raw, np.int16).reshape(-1, channels))
+
+        wav_ms = _time_ms(lambda: pygame.mixer.Sound(wav_path))
+        pcm_ms = _time_ms(lambda: pygame.mixer.Sound(buffer=np.load(npy_path, mmap_mode="r")))
+        index[name] = {"format": list(fmt), "mtime": mtime,
+                       "wav_ms": round(wav_ms, 2), "pcm_ms": round(pcm_ms, 2)}
+        total_saved += wav_ms - pcm_ms
+        print(f"[pcm] {name}: {len(raw) // (2 * channels) / freq:6.1f} s   "
+              f"wav {wav_ms:6.1f} ms  pcm {pcm_ms:6.1f} ms  saved {wav_ms - pcm_ms:6.1f} ms")
+        _write_index(idx_path, index)               # as we go – a later crash keeps these
+
+    _write_index(idx_path, index)
+    print(f"[pcm] {len(index)} clips cached, {total_saved:.0f} ms saved this run")
+    return index
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--hd", default=HD_DIR, help="folder with the WAVs")
+    ap.add_argument("--force", action="store_true", help="rebuild every clip")
+    args = ap.parse_args()
+
+    if not os.path.isdir(args.hd):
+        sys.exit(f"No such folder: {args.hd}")
+
+    pygame.mixer.pre_init(*MIXER_INIT)
+    pygame.mixer.init()
+    try:
+        ingest(args.hd, force=args.force)
+    finally:
+        pygame.mixer.quit()
+
+
+if __name__ == "__main__":
+    main()
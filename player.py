@@ -3,7 +3,7 @@ import cv2
 import pygame
 import time
 
-from clip_utils import start_clip, update_clips, active_clips, master_gain
+from clip_utils import start_clip, update_clips, active_clips, master_gain, MIXER_INIT, NUM_CHANNELS
 
 HD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "HD")
 
@@ -64,9 +64,9 @@ def main():
         print("No matching .mp4/.wav pairs in HD/"); return
 
     # --- robust mixer initialisation ---------------------------
-    pygame.mixer.pre_init(44100, -16, 2, 512)   # 44.1 kHz, 16-bit, stereo
+    pygame.mixer.pre_init(*MIXER_INIT)          # 44.1 kHz, 16-bit, stereo
     pygame.init()
-    pygame.mixer.set_num_channels(32)           # plenty of mixing room
+    pygame.mixer.set_num_channels(NUM_CHANNELS) # plenty of mixing room
     # -----------------------------------------------------------
 
     idx = 0
@@ -5,6 +5,8 @@ that stays open while clips change.
 
 Random  : random clip every 1–60 s, audio loops stack (START ⇒ user)
 User    : NEXT advances sequentially, QUIT ⇒ random
+Synced  : LOOPER_SYNC=leader|follower – several screens follow one shared,
+          seeded random schedule in lockstep (see sync.py); buttons ignored
 
 Keyboard fallback (when LOOPER_SERVER unset):
     any key → NEXT,   q → quit program
@@ -13,10 +15,15 @@ All video is forced to 24 fps so playback speed is correct.
 """
 import os, time, random, cv2, pygame, requests, sys
 import clip_utils                                              # ← NEW
-from clip_utils import start_clip, update_clips, active_clips, master_gain
+import profiler
+import sync
+from clip_utils import arm_clip, start_clip, start_scene, update_clips, master_gain
+from clip_utils import MIXER_INIT, NUM_CHANNELS
 
 HD_DIR     = os.path.join(os.path.dirname(os.path.abspath(__file__)), "HD")
 SERVER_URL = os.environ.get("LOOPER_SERVER")       # e.g. "http://…/command"
+SYNC_ROLE  = os.environ.get("LOOPER_SYNC")         # "leader" / "follower" / None
+_last_cmd_t = None                                 # perf_counter() of the last NEXT/QUIT
 
 # ───────────────────── helper utilities ──────────────────────
 def list_clips() -> list[str]:
@@ -28,23 +35,40 @@ def list_clips() -> list[str]:
     return sorted(good)
 
 def get_remote_command():
-    """Poll the Flask server once; return 'next', 'quit' or None."""
+    """Poll the Flask server once; return 'next', 'quit' or None.
+
+    'scene' and 'profile' commands are applied right here (all layers start
+    together via clip_utils.start_scene / a background stack sampler starts)
+    and then reported as None, so the current video keeps playing.
+    """
+    global _last_cmd_t
     try:
         r = requests.get(SERVER_URL, timeout=0.5)
-        return r.json().get("command")
+        msg = r.json()
     except Exception:
         return None
+    cmd = msg.get("command")
+    if cmd == "scene":
+        started = start_scene(msg.get("clips", []), HD_DIR, stop=msg.get("stop", []))
+        print(f"\n🎬 Scene: {', '.join(started) or '(stop only)'}")
+        return None
+    if cmd == "profile":
+        profiler.start_profile(msg.get("seconds", 10))
+        return None
+    if cmd:
+        _last_cmd_t = time.perf_counter()
+    return cmd
 
 # ─────────────────── reset mixer helper (NEW) ─────────────────
 def reset_mixer():
-    """Completely restart pygame.mixer and clear clip_utils state."""
-    pygame.mixer.quit()
-    pygame.mixer.pre_init(44100, -16, 2, 512)
-    pygame.mixer.init()
-    pygame.mixer.set_num_channels(32)
-
-    active_clips.clear()
-    clip_utils.solo_owner = None
+    """Fade out and clear clip_utils state between modes.
+
+    The mixer stays open and the Sounds that were playing stay cached, so
+    the next mode's first clip starts without a device re-open or reload.
+    clip_utils logs the time from the button press to that first clip.
+    """
+    clip_utils.reset_state(requested_at=_last_cmd_t)
+    print(f"[audio] mode switch: {len(clip_utils.sound_cache)} sounds kept")
 # ──────────────────────────────────────────────────────────────
 
 
@@ -129,6 +153,44 @@ def timed_video_player(path: str, duration: int) -> str:
         _frame_delay(frame_start)
 
     cap.release(); return "timeout"
+
+def synced_video_player(cap, first_frame, start: float, end: float, arm_at: float, arm):
+    """
+    Show a pre-armed clip from local time `start` to `end`, locking frame n
+    to start + n·FRAME_DT so every node shows the same frame at once.
+    Calls `arm()` once at local time `arm_at` to prepare the next slot.
+    Returns ("quit" | "end", whatever arm() returned).
+    """
+    shown, frame, armed = 0, first_frame, None
+    cv2.imshow("Video", frame); cv2.waitKey(1)
+    while True:
+        now = time.time()
+        if now >= end:
+            return "end", armed
+        if armed is None and now >= arm_at:
+            armed = arm() or False                  # False = tried, nothing to show
+
+        due = int((now - start) / FRAME_DT)
+        while shown < due:                          # catch up (grab skips decode-to-BGR)
+            if not cap.grab():
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0); cap.grab()
+            shown += 1
+        ok, f = cap.retrieve()
+        if ok:
+            frame = f
+        cv2.imshow("Video", frame)
+        k = cv2.waitKey(1) & 0xFF
+
+        # schedule comes from the leader: NEXT/QUIT are ignored, but scene and
+        # profile still work and 'q' still quits when there is no remote
+        if SERVER_URL is None:
+            if k == ord('q'):
+                return "quit", armed
+        else:
+            get_remote_command()
+
+        update_clips(FRAME_DT)
+        sync.sleep_until(min(end, start + (shown + 1) * FRAME_DT))
 # ──────────────────────────────────────────────────────────────
 
 
@@ -142,7 +204,7 @@ def random_mode(clips: list[str]) -> None:
 
         res = timed_video_player(os.path.join(HD_DIR, f"{clip}.mov"), duration)
         if res == "start":
-            pygame.mixer.stop(); return             # → user_mode
+            return                                  # → user_mode (reset fades out)
 
 def user_mode(clips: list[str]) -> None:
     idx = 0
@@ -153,8 +215,59 @@ def user_mode(clips: list[str]) -> None:
 
         res = video_player(os.path.join(HD_DIR, f"{clip}.mov"))
         if res == "quit":
-            pygame.mixer.stop(); return             # → random_mode
+            return                                  # → random_mode (reset fades out)
         idx = (idx + 1) % len(clips)
+
+def _arm_slot(slot, seed):
+    """Open + decode frame 0 and load the WAV; same seeded picks on every node."""
+    random.seed(f"{seed}:{slot.k}:arm")
+    cap = cv2.VideoCapture(os.path.join(HD_DIR, f"{slot.clip}.mov"))
+    ok, first = cap.read() if cap.isOpened() else (False, None)
+    if not ok or not arm_clip(slot.clip, HD_DIR):
+        print(f"Couldn't arm {slot.clip}"); cap.release()
+        return None
+    return cap, first
+
+def synced_mode(node) -> str:
+    """Follow the shared schedule; returns "quit" on 'q', "replan" on a new leader."""
+    seed = node.plan["seed"]
+    upcoming = (s for s in node.slots() if s.end > node.leader_now())
+    slot = next(upcoming)
+    sync.sleep_until(node.to_local(slot.at) - sync.ARM_AHEAD)
+    armed = _arm_slot(slot, seed)
+
+    while True:
+        if node.plan["seed"] != seed:               # leader restarted → new plan
+            if armed:
+                armed[0].release()
+            return "replan"
+        nxt = next(upcoming)
+        start, end = node.to_local(slot.at), node.to_local(slot.end)
+        if not armed:                               # nothing to show – sit the slot out
+            sync.sleep_until(node.to_local(nxt.at) - sync.ARM_AHEAD)
+            armed = _arm_slot(nxt, seed)
+            slot = nxt
+            continue
+        cap, first = armed
+
+        sync.sleep_until(start)
+        random.seed(f"{seed}:{slot.k}:start")       # _o/_v picks match across nodes
+        start_clip(slot.clip, HD_DIR)
+        err_ms = (node.leader_now() - slot.at) * 1000.0
+        node.report(slot.k, err_ms)
+        print(f"\n⏱ Synced: '{slot.clip}' slot {slot.k} for {slot.dur:g}s (late {err_ms:+.1f} ms)")
+
+        res, armed = synced_video_player(cap, first, start, end,
+                                         node.to_local(nxt.at) - sync.ARM_AHEAD,
+                                         lambda: _arm_slot(nxt, seed))
+        cap.release()
+        if res == "quit":
+            if armed:
+                armed[0].release()
+            return "quit"
+        if armed is None:                           # slot ended before the arm point
+            armed = _arm_slot(nxt, seed)
+        slot = nxt
 # ──────────────────────────────────────────────────────────────
 
 
@@ -163,8 +276,8 @@ def main():
     if not clips:
         print("No matching .mov/.wav pairs in HD/"); return
 
-    pygame.mixer.pre_init(44100, -16, 2, 512)
-    pygame.init(); pygame.mixer.set_num_channels(32)
+    pygame.mixer.pre_init(*MIXER_INIT)
+    pygame.init(); pygame.mixer.set_num_channels(NUM_CHANNELS)
 
     # ── create the full-screen window once ──
     cv2.namedWindow("Video", cv2.WINDOW_NORMAL)
@@ -172,6 +285,12 @@ def main():
                           cv2.WND_PROP_FULLSCREEN,
                           cv2.WINDOW_FULLSCREEN)
 
+    if SYNC_ROLE:
+        node = sync.make_node(SYNC_ROLE, clips)
+        while synced_mode(node) != "quit":
+            pass
+        return
+
     while True:
         random_mode(clips)
         reset_mixer()
@@ -0,0 +1,141 @@
+"""On‑demand sampling profiler for the running player.
+
+Nothing here runs until :func:`start_profile` is called, so the player pays
+zero overhead between captures.  While active, a daemon thread grabs the
+main thread's Python stack every ``interval`` seconds via
+``sys._current_frames()`` and, when done, writes
+
+    profiles/profile-<timestamp>.folded   collapsed stacks (speedscope,
+                                          flamegraph.pl, inferno, …)
+
+Every stack is rooted at its *subsystem* so the viewer groups by it:
+
+    decode        cap.read / cap.set / cap.grab / cap.retrieve
+    display       cv2.imshow / cv2.waitKey
+    update_clips  clip_utils.update_clips (mixer volume/pan work)
+    command_poll  get_remote_command (HTTP poll + scene/profile handling)
+    pacing        _frame_delay / sync.sleep_until
+    other         anything else (clip start, WAV loads, …)
+
+Caveat: the sampler is a Python thread, so it only runs when it gets the
+GIL – i.e. when the main thread blocks in C (decode, waitKey, sleep) or the
+interpreter forces a switch.  Short pure‑Python stretches such as
+update_clips are therefore *under*‑sampled.  To shrink that bias the switch
+interval (sys.setswitchinterval, process‑wide) is lowered to
+``SWITCH_INTERVAL`` for the duration of a capture and restored afterwards.
+"""
+
+from __future__ import annotations
+
+import linecache
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+PROFILE_DIR: str       = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+SAMPLE_INTERVAL: float = 0.005    # 200 Hz
+MAX_SECONDS: float     = 120.0
+SWITCH_INTERVAL: float = 0.0005   # GIL hand‑off while capturing (default 0.005)
+
+_worker: Optional[threading.Thread] = None
+
+# function name on the stack → subsystem (checked innermost first)
+_FUNC_SUBSYSTEM = {
+    "update_clips": "update_clips",
+    "get_remote_command": "command_poll",
+    "_frame_delay": "pacing",
+    "sleep_until": "pacing",
+}
+# for frames inside the video loops, classify by the source line
+_LINE_SUBSYSTEM = (
+    ("cap.read", "decode"),
+    ("cap.set", "decode"),
+    ("cap.grab", "decode"),
+    ("cap.retrieve", "decode"),
+    ("imshow", "display"),
+    ("waitKey", "display"),
+)
+
+
+def _classify(frame) -> str:
+    f = frame
+    while f is not None:
+        name = f.f_code.co_name
+        if name in _FUNC_SUBSYSTEM:
+            return _FUNC_SUBSYSTEM[name]
+        f = f.f_back
+    # innermost frame is the video loop itself → look at the current line
+    line = linecache.getline(frame.f_code.co_filename, frame.f_lineno)
+    for needle, subsystem in _LINE_SUBSYSTEM:
+        if needle in line:
+            return subsystem
+    return "other"
+
+
+def _stack(frame) -> str:
+    parts = []
+    f = frame
+    while f is not None:
+        code = f.f_code
+        parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{f.f_lineno})")
+        f = f.f_back
+    return ";".join(reversed(parts))
+
+
+def _run(thread_id: int, seconds: float, interval: float, out_dir: str) -> None:
+    stacks: Counter[str] = Counter()
+    per_subsystem: Counter[str] = Counter()
+
+    old_switch = sys.getswitchinterval()
+    sys.setswitchinterval(min(old_switch, SWITCH_INTERVAL))
+    try:
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:               # target thread exited
+                break
+            subsystem = _classify(frame)
+            per_subsystem[subsystem] += 1
+            stacks[f"{subsystem};{_stack(frame)}"] += 1
+            del frame
+            time.sleep(interval)
+    finally:
+        sys.setswitchinterval(old_switch)
+
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, time.strftime("profile-%Y%m%d-%H%M%S.folded"))
+    with open(path, "w") as fh:
+        for stack, n in stacks.most_common():
+            fh.write(f"{stack} {n}\n")
+
+    total = sum(per_subsystem.values()) or 1
+    print(f"\n[profile] {total} samples → {path}")
+    for subsystem, n in per_subsystem.most_common():
+        print(f"[profile]   {subsystem:<13} {100.0 * n / total:5.1f} %")
+    print("[profile] note: GIL‑bound sampler – short pure‑Python work "
+          "(update_clips, …) reads low; C calls (decode, display, sleep) read high")
+
+
+def start_profile(seconds: float, interval: float = SAMPLE_INTERVAL,
+                  out_dir: str = PROFILE_DIR) -> bool:
+    """Sample the *calling* thread for *seconds* in the background.
+
+    Returns False (and does nothing) if a capture is already running.
+    """
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        print("[profile] capture already running")
+        return False
+    seconds = max(0.1, min(float(seconds), MAX_SECONDS))
+    _worker = threading.Thread(
+        target=_run,
+        args=(threading.get_ident(), seconds, interval, out_dir),
+        name="profiler",
+        daemon=True,
+    )
+    _worker.start()
+    print(f"\n[profile] sampling for {seconds:g}s …")
+    return True
@@ -2,11 +2,19 @@
 # LAN-remote controller *and* launcher for the video-looper demo.
 # pip install flask
 
-import os, sys, subprocess
-from flask import Flask, jsonify, redirect
+import os, sys, time, gzip, hashlib, subprocess, threading
+from collections import deque
+from flask import Flask, Response, jsonify, redirect, request
 
 app = Flask(__name__, static_folder=None)
-_command = None            # “next”, “quit”, None  – read-once by the player
+# pending command – read-once by the player.  One (cmd, payload, set_at) tuple
+# behind a lock: the dev server is threaded, so a press and a poll can overlap.
+#   cmd      “next”, “quit”, “scene”, “profile”
+#   payload  extra fields (scene clips, profile seconds)
+#   set_at   perf_counter() when it was set
+_slot = None
+_slot_lock = threading.Lock()
+_ack_ms = deque(maxlen=50) # recent press → player-poll latencies (ms)
 
 # ──────────────────────── minimal HTML UI ───────────────────────────
 HTML = """
@@ -80,6 +88,15 @@ body{font-family:sans-serif}
 </div>
 
 <script>
+/* Send button presses in the background – no page reload, tiny 204 reply.
+   The plain links still work if JS is off. */
+document.querySelectorAll(".top-bar a").forEach(a => {
+  a.addEventListener("click", ev => {
+    ev.preventDefault();
+    fetch(a.getAttribute("href") + "?bg=1", {cache: "no-store"}).catch(() => {});
+  });
+});
+
 /* Preserve scroll position of the log textarea across page reloads */
 window.addEventListener("DOMContentLoaded", () => {
   const log = document.getElementById("log");
@@ -101,27 +118,93 @@ window.addEventListener("DOMContentLoaded", () => {
 
 # ────────────────────────────────────────────────────────────────────
 
+# the page never changes at runtime → compress + hash it once
+_HTML_BYTES = HTML.encode("utf-8")
+_HTML_GZIP  = gzip.compress(_HTML_BYTES, compresslevel=9)
+_HTML_ETAG  = hashlib.sha1(_HTML_BYTES).hexdigest()[:16]
+
+def _set_command(cmd: str, **payload) -> dict:
+    global _slot
+    with _slot_lock:
+        _slot = (cmd, payload, time.perf_counter())
+    return payload
+
+def _button_reply():
+    """204 for background presses, redirect for the no-JS fallback."""
+    if request.args.get("bg"):
+        return Response(status=204)
+    return redirect("/")
+
 @app.get("/")           # phone home-page
 def index():
-    return HTML
+    # each representation gets its own strong validator (RFC 7232 §2.3.3)
+    gz = "gzip" in request.headers.get("Accept-Encoding", "")
+    etag = f"{_HTML_ETAG}-gz" if gz else _HTML_ETAG
+    headers = {
+        "ETag": f'"{etag}"',
+        "Cache-Control": "public, max-age=86400",
+        "Vary": "Accept-Encoding",
+    }
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers=headers)
+    if gz:
+        headers["Content-Encoding"] = "gzip"
+    return Response(_HTML_GZIP if gz else _HTML_BYTES, mimetype="text/html", headers=headers)
 
 @app.get("/next")       # big green button
 def next_cmd():
-    global _command
-    _command = "next"
-    return redirect("/")
+    _set_command("next")
+    return _button_reply()
 
 @app.get("/quit")       # big red button
 def quit_cmd():
-    global _command
-    _command = "quit"
-    return redirect("/")
+    _set_command("quit")
+    return _button_reply()
+
+def _csv_arg(name: str) -> list[str]:
+    return [c.strip() for c in request.args.get(name, "").split(",") if c.strip()]
+
+@app.get("/scene")      # /scene?clips=a,b,c&stop=d,e  – one atomic batch
+def scene_cmd():
+    clips, stop = _csv_arg("clips"), _csv_arg("stop")
+    if not clips and not stop:
+        return jsonify({"error": "need ?clips= and/or ?stop="}), 400
+    payload = _set_command("scene", clips=clips, stop=stop)
+    return jsonify({"command": "scene", **payload})
+
+@app.get("/profile")    # /profile?seconds=10  – sampled stack profile on the player
+def profile_cmd():
+    try:
+        seconds = float(request.args.get("seconds", 10))
+    except ValueError:
+        return jsonify({"error": "seconds must be a number"}), 400
+    payload = _set_command("profile", seconds=max(1.0, min(seconds, 120.0)))
+    return jsonify({"command": "profile", **payload})
 
 @app.get("/command")    # polled by player_remote.py
 def get_command():
-    global _command
-    cmd, _command = _command, None     # one-shot read
-    return jsonify({"command": cmd})
+    global _slot
+    with _slot_lock:
+        slot, _slot = _slot, None      # one-shot read
+    if slot is None:
+        return jsonify({"command": None})
+    cmd, payload, set_at = slot
+    ms = (time.perf_counter() - set_at) * 1000.0
+    _ack_ms.append(ms)
+    print(f"[remote] {cmd} acknowledged by player after {ms:.0f} ms")
+    return jsonify({"command": cmd, **payload})
+
+@app.get("/timing")     # press → player acknowledgement latency
+def timing():
+    ms = sorted(_ack_ms)
+    if not ms:
+        return jsonify({"count": 0})
+    return jsonify({
+        "count": len(ms),
+        "last_ms": round(_ack_ms[-1], 1),
+        "median_ms": round(ms[len(ms) // 2], 1),
+        "max_ms": round(ms[-1], 1),
+    })
 
 # ─────────────────────── launch the player once ─────────────────────
 def launch_player():
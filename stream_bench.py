@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Loopback stand‑in for the Raspberry Pi receiver: measure what the
+clip_streamer back‑ends actually put on the wire.
+
+Listens on the same UDP ports the Pi would and parses either
+    ts   MPEG‑TS over UDP   (start_stream_ffmpeg, 7×188‑byte packets)
+    rtp  RTP/H.264 + AAC    (start_stream_gst, video + audio ports)
+and reports packet rate, bitrate, RFC 3550‑style inter‑arrival jitter
+(against PCR for TS, RTP timestamps for RTP), loss and gaps.
+
+Receive only (point a real sender at this machine):
+    python stream_bench.py listen --method ffmpeg --port 1234 --seconds 30
+
+Automated benchmark on loopback (no Pi): cycles through HD clips exactly
+like clip_streamer.main() does and measures start‑up time and the silent
+gap at every clip switch:
+    python stream_bench.py bench --method gst --clips 4 --dwell 8 --json out.json
+"""
+import os, sys, json, time, bisect, socket, struct, argparse, selectors, threading
+from typing import Optional
+
+GAP_THRESHOLD: float = 0.2        # s without packets that counts as a gap
+TS_PACKET: int       = 188
+PCR_HZ: int          = 27_000_000
+RTP_CLOCKS           = {96: 90_000, 97: 44_100}   # pt → clock rate; 97 follows the
+                                                  # audio caps pinned in start_stream_gst (--audio-clock)
+
+# ────────────────────────────────────────────────────────────────────
+#  Per‑port statistics
+# ────────────────────────────────────────────────────────────────────
+
+class PortStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.packets = 0
+        self.bytes = 0
+        self.first: Optional[float] = None
+        self.last: Optional[float] = None
+        self.gaps: list[tuple[float, float]] = []      # (start time, length)
+        self.arrivals: list[float] = []                # every datagram time (for switch gaps)
+
+        # jitter state (RFC 3550 §6.4.1, in seconds)
+        self.jitter = 0.0
+        self.max_jitter = 0.0
+        self._transit: Optional[float] = None
+
+        self.lost = 0               # RTP seq holes / TS continuity errors
+        self.resets = 0             # sender restart, new SSRC or PCR jump (≈ clip switch)
+        self._rtp_seq: Optional[int] = None
+        self._rtp_ssrc: Optional[int] = None
+        self._ts_cc: dict[int, int] = {}
+        self._last_pcr: Optional[float] = None
+        self._restart_pending = False
+
+    # -- generic -----------------------------------------------------
+    def expect_restart(self):
+        """Sender is about to restart: reset counters on the next packet."""
+        self._restart_pending = True
+
+    def arrival(self, t: float, size: int):
+        if self._restart_pending:
+            self._restart_pending = False
+            if self.packets:
+                self.reset_timing()        # count it here: _forget() hides it from the parsers
+            else:
+                self._forget()
+        if self.last is not None and t - self.last >= GAP_THRESHOLD:
+            self.gaps.append((self.last, t - self.last))
+        if self.first is None:
+            self.first = t
+        self.last = t
+        self.packets += 1
+        self.bytes += size
+        self.arrivals.append(t)
+
+    def media_time(self, t: float, media_s: float):
+        transit = t - media_s
+        if self._transit is not None:
+            d = abs(transit - self._transit)
+            self.jitter += (d - self.jitter) / 16.0
+            self.max_jitter = max(self.max_jitter, self.jitter)
+        self._transit = transit
+
+    def _forget(self):
+        """New sender: drop jitter transit, TS continuity and PCR/SSRC/seq history."""
+        self._transit = None
+        self._ts_cc.clear()
+        self._last_pcr = None
+        self._rtp_ssrc = None
+        self._rtp_seq = None
+
+    def reset_timing(self):
+        self._forget()
+        self.resets += 1
+
+    # -- report ------------------------------------------------------
+    def summary(self) -> dict:
+        span = (self.last - self.first) if self.packets > 1 else 0.0
+        return {
+            "port": self.name,
+            "packets": self.packets,
+            "packet_rate": round(self.packets / span, 1) if span else 0.0,
+            "bitrate_kbps": round(self.bytes * 8 / span / 1000, 1) if span else 0.0,
+            "jitter_ms": round(self.jitter * 1000, 2),
+            "max_jitter_ms": round(self.max_jitter * 1000, 2),
+            "lost": self.lost,
+            "resets": self.resets,
+            "gaps": len(self.gaps),
+            "max_gap_ms": round(max((g for _, g in self.gaps), default=0.0) * 1000, 1),
+        }
+
+# ────────────────────────────────────────────────────────────────────
+#  Parsers
+# ────────────────────────────────────────────────────────────────────
+
+def parse_ts(buf: bytes, t: float, st: PortStats):
+    """Walk 188‑byte TS packets: continuity counters + PCR timing."""
+    for i in range(0, len(buf) - TS_PACKET + 1, TS_PACKET):
+        pkt = buf[i:i + TS_PACKET]
+        if pkt[0] != 0x47:
+            continue
+        pid = ((pkt[1] & 0x1F) << 8) | pkt[2]
+        afc = (pkt[3] >> 4) & 0x3
+        cc = pkt[3] & 0x0F
+        if pid == 0x1FFF:                              # null packet
+            continue
+
+        if afc & 0x1:                                  # has payload → CC increments
+            prev = st._ts_cc.get(pid)
+            if prev is not None and cc != (prev + 1) & 0x0F and cc != prev:
+                st.lost += 1
+            st._ts_cc[pid] = cc
+
+        if afc & 0x2 and pkt[4] >= 7 and pkt[5] & 0x10:  # adaptation field with PCR
+            if pkt[5] & 0x80:                          # discontinuity_indicator
+                st.reset_timing()
+            b = pkt[6:12]
+            base = (b[0] << 25) | (b[1] << 17) | (b[2] << 9) | (b[3] << 1) | (b[4] >> 7)
+            ext = ((b[4] & 0x01) << 8) | b[5]
+            pcr = (base * 300 + ext) / PCR_HZ
+            if st._last_pcr is not None and not (0.0 <= pcr - st._last_pcr < 1.0):
+                st.reset_timing()                      # new ffmpeg process / wrap
+            st._last_pcr = pcr
+            st.media_time(t, pcr)
+
+
+def parse_rtp(buf: bytes, t: float, st: PortStats):
+    """RTP fixed header: seq holes, SSRC changes and timestamp jitter."""
+    if len(buf) < 12 or buf[0] >> 6 != 2:
+        return
+    pt = buf[1] & 0x7F
+    seq, ts, ssrc = struct.unpack("!HII", buf[2:12])
+
+    if ssrc != st._rtp_ssrc:
+        if st._rtp_ssrc is not None:
+            st.reset_timing()                          # new gst pipeline
+        st._rtp_ssrc, st._rtp_seq = ssrc, None
+    if st._rtp_seq is not None:
+        hole = (seq - st._rtp_seq - 1) & 0xFFFF
+        if hole < 0x8000:
+            st.lost += hole
+    st._rtp_seq = seq
+
+    st.media_time(t, ts / RTP_CLOCKS.get(pt, 90_000))
+
+# ────────────────────────────────────────────────────────────────────
+#  Receiver
+# ────────────────────────────────────────────────────────────────────
+
+class Receiver:
+    """Bind UDP ports and collect stats on a background thread."""
+
+    def __init__(self, ports: list[int], kind: str, host: str = "0.0.0.0"):
+        self.parse = parse_ts if kind == "ts" else parse_rtp
+        self.stats = {p: PortStats(str(p)) for p in ports}
+        self._sel = selectors.DefaultSelector()
+        for p in ports:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+            s.bind((host, p))
+            s.setblocking(False)
+            self._sel.register(s, selectors.EVENT_READ, p)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="receiver", daemon=True)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            for key, _ in self._sel.select(timeout=0.05):
+                while True:
+                    try:
+                        buf = key.fileobj.recv(65536)
+                    except BlockingIOError:
+                        break
+                    t = time.perf_counter()
+                    st = self.stats[key.data]
+                    st.arrival(t, len(buf))
+                    self.parse(buf, t, st)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def expect_restart(self):
+        for st in self.stats.values():
+            st.expect_restart()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        for key in list(self._sel.get_map().values()):
+            key.fileobj.close()
+        self._sel.close()
+
+
+def _switch_report(st: PortStats, switches: list[float]) -> list[dict]:
+    """Start‑up time and gap for each sender restart."""
+    out = []
+    arr = st.arrivals
+    for t_sw in switches:
+        i = bisect.bisect_left(arr, t_sw)
+        if i == len(arr):
+            out.append({"startup_ms": None, "gap_ms": None})
+            continue
+        first = arr[i]
+        out.append({
+            "startup_ms": round((first - t_sw) * 1000, 1),
+            "gap_ms": round((first - arr[i - 1]) * 1000, 1) if i else None,
+        })
+    return out
+
+
+def _print_report(report: dict):
+    for s in report["ports"]:
+        print(f"[bench] port {s['port']:>5}: {s['packets']} pkts  {s['packet_rate']} pkt/s  "
+              f"{s['bitrate_kbps']} kbit/s  jitter {s['jitter_ms']} ms (max {s['max_jitter_ms']})  "
+              f"lost {s['lost']}  gaps {s['gaps']} (max {s['max_gap_ms']} ms)")
+    for i, sw in enumerate(report.get("switches", [])):
+        print(f"[bench] switch {i}: " + "  ".join(
+            f"{p}: start‑up {v['startup_ms']} ms, gap {v['gap_ms']} ms" for p, v in sw.items()))
+
+# ────────────────────────────────────────────────────────────────────
+#  Modes
+# ────────────────────────────────────────────────────────────────────
+
+def _ports(method: str, port: int) -> tuple[str, list[int]]:
+    return ("ts", [port]) if method == "ffmpeg" else ("rtp", [port, port + 2])
+
+
+def listen(method: str, port: int, seconds: float) -> dict:
+    kind, ports = _ports(method, port)
+    rx = Receiver(ports, kind).start()
+    print(f"[bench] listening on {ports} ({kind}) for {seconds:g}s …")
+    try:
+        time.sleep(seconds)
+    finally:
+        rx.stop()
+    return {"method": method, "ports": [st.summary() for st in rx.stats.values()]}
+
+
+def bench(method: str, port: int, n_clips: int, dwell: float) -> dict:
+    """Drive clip_streamer's senders at 127.0.0.1 and measure every switch."""
+    from clip_streamer import HD_DIR, list_clips, start_stream_ffmpeg, start_stream_gst, stop_process
+
+    clips = list_clips()[:n_clips]
+    if not clips:
+        raise SystemExit("No matching .mp4/.wav pairs in HD/")
+
+    kind, ports = _ports(method, port)
+    rx = Receiver(ports, kind, host="127.0.0.1").start()
+    switches: list[float] = []
+    proc = None
+    try:
+        for clip in clips:
+            path = os.path.join(HD_DIR, f"{clip}.mp4")
+            stop_process(proc)                          # same order as clip_streamer.main()
+            rx.expect_restart()
+            switches.append(time.perf_counter())
+            if method == "ffmpeg":
+                proc = start_stream_ffmpeg(path, "127.0.0.1", port=port)
+            else:
+                proc = start_stream_gst(path, "127.0.0.1", v_port=port, a_port=port + 2)
+            time.sleep(dwell)
+    finally:
+        stop_process(proc)
+        time.sleep(GAP_THRESHOLD)
+        rx.stop()
+
+    per_port = {st.name: _switch_report(st, switches) for st in rx.stats.values()}
+    return {
+        "method": method,
+        "clips": clips,
+        "dwell_s": dwell,
+        "ports": [st.summary() for st in rx.stats.values()],
+        "switches": [{p: per_port[p][i] for p in per_port} for i in range(len(switches))],
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    ap.add_argument("mode", choices=("listen", "bench"))
+    ap.add_argument("--method", choices=("ffmpeg", "gst"), default="ffmpeg",
+                    help="ffmpeg → MPEG‑TS on --port, gst → RTP on --port and --port+2")
+    ap.add_argument("--port", type=int, default=1234)
+    ap.add_argument("--seconds", type=float, default=30.0, help="listen duration")
+    ap.add_argument("--clips", type=int, default=3, help="bench: number of clips to cycle")
+    ap.add_argument("--dwell", type=float, default=8.0, help="bench: seconds per clip")
+    ap.add_argument("--audio-clock", type=int, default=RTP_CLOCKS[97],
+                    help="RTP clock (Hz) of the AAC stream (pt 97)")
+    ap.add_argument("--json", help="also write the report to this file")
+    args = ap.parse_args()
+    RTP_CLOCKS[97] = args.audio_clock
+
+    if args.mode == "listen":
+        report = listen(args.method, args.port, args.seconds)
+    else:
+        report = bench(args.method, args.port, args.clips, args.dwell)
+
+    _print_report(report)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(report, fh, indent=1)
+
+    # non‑zero exit if nothing arrived, so CI notices a dead sender
+    sys.exit(0 if all(p["packets"] for p in report["ports"]) else 1)
+
+
+if __name__ == "__main__":
+    main()
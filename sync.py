@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Leader/follower clock + clip schedule for running several players in lockstep.
+
+The leader multicasts a *plan* on the LAN every ``BEACON_INTERVAL`` s:
+
+    {"type": "plan", "seed": …, "epoch": …, "clips": […], "dmin": 1, "dmax": 60}
+
+The schedule is fully determined by the plan (seeded ``random.Random``, same
+picks/durations as ``random_mode``), so every node computes identical switch
+timestamps in *leader time*.  Followers estimate the leader's clock with
+NTP‑style ping/pong over unicast (offset from the lowest‑RTT sample), convert
+each deadline to their local clock, pre‑arm the next clip and switch on it.
+Every node reports how late it actually switched; the leader prints the
+inter‑node skew per slot.
+
+Headless test with several processes on one host (no video/audio needed):
+
+    python sync.py leader   --clips a,b,c --dmin 1 --dmax 3
+    python sync.py follower --node B
+    python sync.py follower --node C
+
+In player_remote.py set ``LOOPER_SYNC=leader`` or ``LOOPER_SYNC=follower``.
+"""
+from __future__ import annotations
+
+import os, json, time, random, socket, struct, argparse, threading
+from collections import deque
+from typing import Iterator, NamedTuple, Optional
+
+SYNC_GROUP: str        = os.environ.get("LOOPER_SYNC_GROUP", "239.255.42.42")
+SYNC_PORT: int         = 5005      # multicast plan beacons
+CLOCK_PORT: int        = 5006      # leader unicast: ping/pong + skew reports
+BEACON_INTERVAL: float = 0.5
+PING_INTERVAL: float   = 1.0
+LEAD_TIME: float       = 3.0       # first slot starts this long after the leader boots
+ARM_AHEAD: float       = 1.0       # pre‑arm the next clip this long before its deadline
+
+
+class Slot(NamedTuple):
+    k: int          # slot index since epoch
+    clip: str
+    at: float       # start, leader time (time.time() on the leader)
+    dur: float
+
+    @property
+    def end(self) -> float:
+        return self.at + self.dur
+
+
+def slots(plan: dict) -> Iterator[Slot]:
+    """Deterministic, endless schedule for a plan."""
+    rng = random.Random(plan["seed"])
+    at, k = plan["epoch"], 0
+    while True:
+        dur = rng.randint(plan["dmin"], plan["dmax"])
+        yield Slot(k, rng.choice(plan["clips"]), at, float(dur))
+        at += dur
+        k += 1
+
+
+def _valid_plan(plan: dict) -> bool:
+    """True if *plan* yields a usable schedule (checked before the main loop sees it)."""
+    try:
+        first = next(slots(plan))
+        first.end                                      # numeric epoch/durations
+    except (KeyError, TypeError, ValueError, IndexError):
+        return False
+    return all(isinstance(c, str) for c in plan["clips"])
+
+
+def sleep_until(t: float) -> None:
+    """Sleep to local wall time *t*; spin the last 2 ms for accuracy."""
+    while True:
+        left = t - time.time()
+        if left <= 0:
+            return
+        time.sleep(left - 0.002 if left > 0.004 else 0)
+
+
+def _send(sock: socket.socket, msg: dict, addr) -> None:
+    sock.sendto(json.dumps(msg).encode(), addr)
+
+
+def _decode(data: bytes) -> Optional[dict]:
+    """JSON object from a datagram, or None for anything else."""
+    try:
+        msg = json.loads(data)
+    except ValueError:                                 # incl. bad UTF‑8
+        return None
+    return msg if isinstance(msg, dict) else None
+
+# ────────────────────────────────────────────────────────────────────
+#  Leader
+# ────────────────────────────────────────────────────────────────────
+
+class Leader:
+    def __init__(self, clips: list[str], dmin: int = 1, dmax: int = 60,
+                 seed: Optional[int] = None, node: str = "leader"):
+        self.node = node
+        self.plan = {
+            "type": "plan",
+            "seed": seed if seed is not None else random.randrange(1 << 30),
+            "epoch": time.time() + LEAD_TIME,
+            "clips": sorted(clips),
+            "dmin": dmin, "dmax": dmax,
+        }
+        self.reports: dict[int, dict[str, float]] = {}
+        self.skews: deque[float] = deque(maxlen=100)
+        self._lock = threading.Lock()          # main loop (report) vs sync-clock thread
+
+        self._mcast = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self._mcast.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 1)
+        self._mcast.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+
+        self._clock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._clock.bind(("", CLOCK_PORT))
+
+        threading.Thread(target=self._beacon, name="sync-beacon", daemon=True).start()
+        threading.Thread(target=self._serve, name="sync-clock", daemon=True).start()
+        print(f"[sync] leader seed={self.plan['seed']} epoch in {LEAD_TIME:g}s, "
+              f"{len(clips)} clips → {SYNC_GROUP}:{SYNC_PORT}")
+
+    def _beacon(self):
+        while True:
+            _send(self._mcast, self.plan, (SYNC_GROUP, SYNC_PORT))
+            time.sleep(BEACON_INTERVAL)
+
+    def _serve(self):
+        while True:
+            data, addr = self._clock.recvfrom(2048)
+            t1 = time.time()
+            msg = _decode(data)
+            if msg is None:
+                continue
+            # a malformed datagram must not kill the clock thread
+            try:
+                if msg.get("type") == "ping":
+                    _send(self._clock, {"type": "pong", "t0": float(msg["t0"]), "t1": t1}, addr)
+                elif msg.get("type") == "report" and isinstance(msg["node"], str):
+                    self._record(int(msg["k"]), msg["node"], float(msg["err_ms"]))
+            except (KeyError, TypeError, ValueError, OverflowError):
+                continue
+
+    def _record(self, k: int, node: str, err_ms: float):
+        with self._lock:
+            errs = self.reports.setdefault(k, {})
+            errs[node] = err_ms
+            for old in [s for s in self.reports if s < k - 10]:
+                del self.reports[old]
+            if len(errs) < 2:
+                return
+            skew = max(errs.values()) - min(errs.values())
+            self.skews.append(skew)
+            n = len(errs)
+        print(f"[sync] slot {k}: skew {skew:.1f} ms over {n} nodes")
+
+    # node interface --------------------------------------------------
+    def ready(self) -> bool:
+        return True
+
+    def slots(self) -> Iterator[Slot]:
+        return slots(self.plan)
+
+    def leader_now(self) -> float:
+        return time.time()
+
+    def to_local(self, t_leader: float) -> float:
+        return t_leader
+
+    def report(self, k: int, err_ms: float):
+        self._record(k, self.node, err_ms)
+
+# ────────────────────────────────────────────────────────────────────
+#  Follower
+# ────────────────────────────────────────────────────────────────────
+
+class Follower:
+    def __init__(self, node: Optional[str] = None):
+        self.node = node or f"{socket.gethostname()}:{os.getpid()}"
+        self.plan: Optional[dict] = None
+        self.leader_addr: Optional[tuple[str, int]] = None
+        self.offset = 0.0                  # leader time − local time
+        self.rtt = float("inf")
+        self._samples: deque[tuple[float, float]] = deque(maxlen=16)   # (rtt, offset)
+
+        self._mcast = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self._mcast.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):            # several followers on one host
+            self._mcast.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self._mcast.bind(("", SYNC_PORT))
+        mreq = struct.pack("4s4s", socket.inet_aton(SYNC_GROUP), socket.inet_aton("0.0.0.0"))
+        self._mcast.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+
+        self._clock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._clock.bind(("", 0))
+
+        threading.Thread(target=self._listen, name="sync-plan", daemon=True).start()
+        threading.Thread(target=self._pong, name="sync-pong", daemon=True).start()
+        threading.Thread(target=self._ping, name="sync-ping", daemon=True).start()
+
+    def _listen(self):
+        while True:
+            data, addr = self._mcast.recvfrom(65536)
+            msg = _decode(data)
+            if msg is None or msg.get("type") != "plan":
+                continue
+            if not _valid_plan(msg):
+                continue
+            if self.plan is None or msg["seed"] != self.plan["seed"]:
+                print(f"[sync] following {addr[0]} seed={msg['seed']}")
+            self.plan = msg
+            self.leader_addr = (addr[0], CLOCK_PORT)
+
+    def _ping(self):
+        while True:
+            if self.leader_addr:
+                _send(self._clock, {"type": "ping", "t0": time.time()}, self.leader_addr)
+            time.sleep(PING_INTERVAL if self._samples else 0.1)
+
+    def _pong(self):
+        while True:
+            data, _ = self._clock.recvfrom(2048)
+            t3 = time.time()
+            msg = _decode(data)
+            if msg is None or msg.get("type") != "pong":
+                continue
+            try:
+                t0, t1 = float(msg["t0"]), float(msg["t1"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            rtt = t3 - t0
+            self._samples.append((rtt, t1 - (t0 + t3) / 2.0))
+            self.rtt, self.offset = min(self._samples)      # least‑delayed sample wins
+
+    # node interface --------------------------------------------------
+    def ready(self) -> bool:
+        return self.plan is not None and bool(self._samples)
+
+    def slots(self) -> Iterator[Slot]:
+        return slots(self.plan)
+
+    def leader_now(self) -> float:
+        return time.time() + self.offset
+
+    def to_local(self, t_leader: float) -> float:
+        return t_leader - self.offset
+
+    def report(self, k: int, err_ms: float):
+        if self.leader_addr:
+            _send(self._clock, {"type": "report", "node": self.node, "k": k, "err_ms": err_ms},
+                  self.leader_addr)
+
+
+def make_node(role: str, clips: list[str]):
+    """Leader or Follower for ``LOOPER_SYNC``; blocks until a follower is synced."""
+    if role not in ("leader", "follower"):
+        raise SystemExit(f"LOOPER_SYNC must be 'leader' or 'follower', not {role!r}")
+    if role == "leader":
+        return Leader(clips)
+    node = Follower()
+    print("[sync] waiting for leader …")
+    while not node.ready():
+        time.sleep(0.1)
+    print(f"[sync] offset {node.offset * 1000:+.1f} ms, rtt {node.rtt * 1000:.1f} ms")
+    return node
+
+# ────────────────────────────────────────────────────────────────────
+#  Headless run (multi‑process test on one host)
+# ────────────────────────────────────────────────────────────────────
+
+def run_headless(node) -> None:
+    plan_seed = node.plan["seed"]
+    for slot in node.slots():
+        if node.plan["seed"] != plan_seed:
+            return run_headless(node)                 # leader restarted
+        if slot.end <= node.leader_now():
+            continue
+        sleep_until(node.to_local(slot.at))
+        err_ms = (node.leader_now() - slot.at) * 1000.0
+        print(f"[sync] {getattr(node, 'node', '')} slot {slot.k} → {slot.clip}  late {err_ms:+.2f} ms")
+        node.report(slot.k, err_ms)
+
+
+def main():
+    ap = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    ap.add_argument("role", choices=("leader", "follower"))
+    ap.add_argument("--clips", default="a,b,c", help="leader: comma‑separated clip names")
+    ap.add_argument("--dmin", type=int, default=1, help="leader: min seconds per clip")
+    ap.add_argument("--dmax", type=int, default=3, help="leader: max seconds per clip")
+    ap.add_argument("--seed", type=int, help="leader: fixed schedule seed")
+    ap.add_argument("--node", help="name used in skew reports")
+    args = ap.parse_args()
+
+    if args.role == "leader":
+        node = Leader(args.clips.split(","), args.dmin, args.dmax, args.seed,
+                      node=args.node or "leader")
+    else:
+        node = Follower(args.node)
+        while not node.ready():
+            time.sleep(0.1)
+    try:
+        run_headless(node)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()